@@ -1,79 +1,52 @@
 import argparse
-import difflib
 import logging
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Sequence
+from typing import Callable, Dict, Optional, Sequence
 
 from air2phin import __project_name__, __version__
 from air2phin.constants import Regexp, Token
-from air2phin.core.rules.config import Config
-from air2phin.core.rules.loader import build_in_rules, path_rule
-from air2phin.runner import Runner
 from air2phin.utils.file import recurse_files
 
 logging.basicConfig(stream=sys.stdout, level=logging.INFO)
 logger = logging.getLogger("air2phin")
 
-common_args: Dict[str, Dict] = {
-    "custom_rules": {
-        "help": f"The custom rule file path you want to add to {__project_name__}.",
-        "action": "append",
-        "type": Path,
-    },
-    "custom_only": {
-        "help": "Only use custom rules and ignore all built-in's, it is helpful for patching the"
-        "exists migration.",
-        "action": "store_true",
-    },
-    "verbose": {
-        "action": "store_true",
-        "help": "Show more verbose output.",
-    },
-}
-
-
-def build_argparse() -> argparse.ArgumentParser:
-    """Build argparse.ArgumentParser with specific configuration."""
-    parser = argparse.ArgumentParser(
-        prog="air2phin",
-        description="Air2phin is a tool for migrating Airflow DAGs to DolphinScheduler Python API.",
-    )
 
-    # Version
+@lru_cache(maxsize=1)
+def _build_common() -> argparse.ArgumentParser:
+    """Build parent parser with common arguments, shared by subcommands ``test`` and ``migrate``."""
+    parser = argparse.ArgumentParser(add_help=False)
     parser.add_argument(
-        "-v",
-        "--version",
-        action="version",
-        version=f"{__project_name__} version {__version__}",
-        help="Show version of %(prog)s.",
-    )
-
-    # Subcommands
-    subparsers = parser.add_subparsers(
-        title="subcommands",
-        dest="subcommand",
-        help=f"Subcommand you want to {__project_name__} to run.",
-    )
-
-    # Test
-    parser_test = subparsers.add_parser(
-        "test", help=f"{__project_name__} playground for migrating with standard input."
-    )
-    parser_test.add_argument(
         "-v",
         "--verbose",
-        **common_args["verbose"],
+        action="store_true",
+        help="Show more verbose output.",
     )
-    parser_test.add_argument(
+    parser.add_argument(
         "-r",
         "--custom-rules",
-        **common_args["custom_rules"],
+        help=f"The custom rule file path you want to add to {__project_name__}.",
+        action="append",
+        type=Path,
     )
-    parser_test.add_argument(
+    parser.add_argument(
         "-R",
         "--custom-only",
-        **common_args["custom_only"],
+        help="Only use custom rules and ignore all built-in's, it is helpful for patching the"
+        "exists migration.",
+        action="store_true",
+    )
+    return parser
+
+
+def _build_test(subparsers: argparse._SubParsersAction) -> None:
+    """Build subcommand ``test`` to subparsers."""
+    parser_test = subparsers.add_parser(
+        "test",
+        help=f"{__project_name__} playground for migrating with standard input.",
+        parents=[_build_common()],
     )
     parser_test.add_argument(
         "-d",
@@ -88,24 +61,13 @@ def build_argparse() -> argparse.ArgumentParser:
         type=str,
     )
 
-    # migrate
+
+def _build_migrate(subparsers: argparse._SubParsersAction) -> None:
+    """Build subcommand ``migrate`` to subparsers."""
     parser_migrate = subparsers.add_parser(
-        "migrate", help="Migrate Airflow DAGs to DolphinScheduler Python definition."
-    )
-    parser_migrate.add_argument(
-        "-v",
-        "--verbose",
-        **common_args["verbose"],
-    )
-    parser_migrate.add_argument(
-        "-r",
-        "--custom-rules",
-        **common_args["custom_rules"],
-    )
-    parser_migrate.add_argument(
-        "-R",
-        "--custom-only",
-        **common_args["custom_only"],
+        "migrate",
+        help="Migrate Airflow DAGs to DolphinScheduler Python definition.",
+        parents=[_build_common()],
     )
     parser_migrate.add_argument(
         "-I",
@@ -144,7 +106,9 @@ def build_argparse() -> argparse.ArgumentParser:
         type=Path,
     )
 
-    # Rule
+
+def _build_rule(subparsers: argparse._SubParsersAction) -> None:
+    """Build subcommand ``rule`` to subparsers."""
     parser_rule = subparsers.add_parser("rule", help="Rule of migrating.")
     parser_rule.add_argument(
         "-s",
@@ -153,23 +117,71 @@ def build_argparse() -> argparse.ArgumentParser:
         help=f"Show all rules for {__project_name__} migrate.",
     )
 
+
+subcommands: Dict[str, Callable[[argparse._SubParsersAction], None]] = {
+    "test": _build_test,
+    "migrate": _build_migrate,
+    "rule": _build_rule,
+}
+
+
+def build_argparse(subcommand: Optional[str] = None) -> argparse.ArgumentParser:
+    """Build argparse.ArgumentParser with specific configuration.
+
+    The parser is cached for each subcommand, so call :func:`main` multiple times will not build it again.
+
+    :param subcommand: Only build the given subcommand's parser when it is one of :data:`subcommands`,
+        build all subcommands' parsers when it is None or unknown, for example ``air2phin --help``.
+    """
+    return _build_argparse(subcommand if subcommand in subcommands else None)
+
+
+@lru_cache(maxsize=None)
+def _build_argparse(subcommand: Optional[str]) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="air2phin",
+        description="Air2phin is a tool for migrating Airflow DAGs to DolphinScheduler Python API.",
+    )
+
+    # Version
+    parser.add_argument(
+        "-v",
+        "--version",
+        action="version",
+        version=f"{__project_name__} version {__version__}",
+        help="Show version of %(prog)s.",
+    )
+
+    # Subcommands
+    subparsers = parser.add_subparsers(
+        title="subcommands",
+        dest="subcommand",
+        help=f"Subcommand you want to {__project_name__} to run.",
+    )
+
+    if subcommand is not None:
+        subcommands[subcommand](subparsers)
+    else:
+        for build in subcommands.values():
+            build(subparsers)
+
     return parser
 
 
 def main(argv: Sequence[str] = None) -> None:
     """Run air2phin in command line."""
-    parser = build_argparse()
     argv = argv if argv is not None else sys.argv[1:]
+    parser = build_argparse(argv[0] if argv else None)
     # argv = ["rule", "--show"]
     args = parser.parse_args(argv)
 
-    if hasattr(args, "verbose") and args.verbose:
+    if getattr(args, "verbose", False):
         logger.setLevel(logging.DEBUG)
     logger.debug("Finish parse air2phin arguments, current args is %s.", args)
 
     # recurse all file in given path
     customs_rules = []
-    if hasattr(args, "custom_rules") and args.custom_rules:
+    if getattr(args, "custom_rules", None):
         for rule in args.custom_rules:
             customs_rules.extend(recurse_files(rule))
     if logger.level <= logging.DEBUG and customs_rules:
@@ -178,7 +190,12 @@ def main(argv: Sequence[str] = None) -> None:
             Token.NEW_LINE.join((f"  {r}" for r in customs_rules)),
         )
 
+    # Import modules only in the subcommand need them, ``libcst`` is heavy and would slow down the simple
+    # subcommand like ``air2phin rule --show`` or ``air2phin --help``
     if args.subcommand == "test":
+        from air2phin.core.rules.config import Config
+        from air2phin.runner import Runner
+
         stdin = args.stdin
         config = Config(customs=customs_rules, customs_only=args.custom_only)
         runner = Runner(config)
@@ -188,20 +205,33 @@ def main(argv: Sequence[str] = None) -> None:
         logger.info(f"Migrated result is: \n{result}")
 
         if args.diff:
+            import difflib
+
             diff = difflib.unified_diff(
                 stdin.splitlines(keepends=True),
                 result.splitlines(keepends=True),
                 fromfile="source",
                 tofile="dest",
             )
-            logger.info(
-                f"The different between source and target is: \n{''.join(diff)}"
-            )
+            # write diff lines directly instead of join them to a huge string and pass to logger
+            sys.stdout.write("The different between source and target is: \n")
+            line = ""
+            for line in diff:
+                sys.stdout.write(line)
+            # end with new line as logger does, the last line do not have it when source without it
+            if not line.endswith(Token.NEW_LINE):
+                sys.stdout.write(Token.NEW_LINE)
+            sys.stdout.flush()
 
     if args.subcommand == "migrate":
-        migrate_files = []
+        from air2phin.core.rules.config import Config
+        from air2phin.runner import Runner
+
+        # files keyed by absolute path to avoid migrating the same file twice when sources overlap
+        migrate_files: Dict[str, Path] = {}
         for path in args.sources:
-            migrate_files.extend(recurse_files(path, args.include, args.exclude))
+            for file in recurse_files(path, args.include, args.exclude, skip_dirs=True):
+                migrate_files.setdefault(os.path.abspath(file), file)
 
         config = Config(
             customs=customs_rules, customs_only=args.custom_only, inplace=args.inplace
@@ -209,12 +239,16 @@ def main(argv: Sequence[str] = None) -> None:
         runner = Runner(config)
 
         if args.multiprocess:
-            runner.with_files_multiprocess(migrate_files, args.multiprocess)
+            runner.with_files_multiprocess(
+                list(migrate_files.values()), args.multiprocess
+            )
         else:
-            runner.with_files(migrate_files)
+            runner.with_files(list(migrate_files.values()))
 
     if args.subcommand == "rule":
         if args.show:
+            from air2phin.core.rules.loader import build_in_rules, path_rule
+
             rules = build_in_rules()
             logger.info(f"Total {len(rules)} rules:\n")
             for rule in rules:
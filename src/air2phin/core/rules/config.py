@@ -1,7 +1,7 @@
 import logging
 import warnings
 from pathlib import Path
-from typing import Any, Dict, List, NamedTuple, Optional
+from typing import Any, Dict, List, NamedTuple, Optional, Set
 
 from air2phin.constants import ConfigKey, Regexp, Token
 from air2phin.core.rules.loader import rule_calls, rule_imports
@@ -26,7 +26,7 @@ class CallConfig(NamedTuple):
     src_short: str
     replace: Dict[str, str]
     add: Dict[str, ParamDefaultConfig]
-    remove: List[str]
+    remove: Set[str]
 
 
 class ImportConfig(NamedTuple):
@@ -75,6 +75,7 @@ class Config:
         # ``from functools import cached_property``
         self._call_migrator: Dict[str, CallConfig] | None = None
         self._import_migrator: Dict[str, ImportConfig] | None = None
+        self._import_roots: Set[str] | None = None
 
     @property
     def imports_path(self) -> List[Path]:
@@ -99,6 +100,29 @@ class Config:
         self._import_migrator = self.imp_migrator()
         return self._import_migrator
 
+    @property
+    def import_roots(self) -> Set[str]:
+        """Get all root module names of import migrator, for quick skipping import statements not in rules.
+
+        For example, root module name of ``airflow.operators.bash.BashOperator`` is ``airflow``.
+        """
+        if self._import_roots is None:
+            self._import_roots = {
+                qualname.split(Token.POINT, 1)[0] for qualname in self.imports
+            }
+        return self._import_roots
+
+    def load_migrators(self) -> None:
+        """Load import and call migrators from rules and cache them.
+
+        It is helpful migrators are loaded before config is passed to other processes, so that they do not
+        need to read and parse rule files again.
+        """
+        if self._import_migrator is None:
+            self._import_migrator = self.imp_migrator()
+        if self._call_migrator is None:
+            self._call_migrator = self.call_migrator()
+
     @property
     def calls_path(self) -> List[Path]:
         """Get all call path for migration rules, the built-in rules before custom rules.
@@ -128,7 +152,7 @@ class Config:
     ) -> CallConfig:
         replace = dict()
         add = dict()
-        remove = []
+        remove = set()
 
         if parameters:
             for p in parameters:
@@ -140,7 +164,7 @@ class Config:
                         value=p[ConfigKey.DEFAULT][ConfigKey.VALUE],
                     )
                 elif p[ConfigKey.ACTION] == ConfigKey.KW_REMOVE:
-                    remove.append(p[ConfigKey.ARGUMENT])
+                    remove.add(p[ConfigKey.ARGUMENT])
                 else:
                     raise ValueError(
                         f"Unknown action type {p[ConfigKey.ACTION]} in {p}"
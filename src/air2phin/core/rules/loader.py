@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pathlib import Path
 from typing import List
 
@@ -15,6 +16,10 @@ rule_imports = [path_dag_cnx, path_operators, path_hooks, path_models, path_util
 rule_calls = [path_dag_cnx, path_operators, path_hooks, path_models]
 
 
+@lru_cache(maxsize=1)
 def build_in_rules() -> List[Path]:
-    """Get all build-in rules in air2phin.rules directory."""
+    """Get all build-in rules in air2phin.rules directory.
+
+    Build-in rules do not change at runtime, so the directory is scanned only once and the result is cached.
+    """
     return [path for path in path_rule.glob("**/*") if path.is_file()]
@@ -14,49 +14,51 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
-from typing import Optional, Sequence, Union
+from functools import lru_cache
+from typing import List, Optional, Sequence, Set, Union
 
 import libcst as cst
-import libcst.matchers as m
 from libcst import FlattenSentinel, RemovalSentinel
+from libcst.helpers import get_full_name_for_node
 
-from air2phin.constants import Token
 from air2phin.core.rules.config import Config, ImportConfig
 
 
+@lru_cache(maxsize=None)
+def _parse_import(statement: str) -> cst.ImportFrom:
+    """Parse import statement from rules to CST node and cache it.
+
+    Statements in rules are fixed, and nodes in libcst are immutable, so the same parsed node can be reused
+    by all matched import statements instead of parsing them each time.
+
+    :param statement: Import statement from rules, like ``from module import name``.
+    """
+    line = cst.ensure_type(cst.parse_statement(statement), cst.SimpleStatementLine)
+    return cst.ensure_type(line.body[0], cst.ImportFrom)
+
+
 class ImportTransformer(cst.CSTTransformer):
     """CST Transformer for airflow operators."""
 
     def __init__(self, config: Config):
         super().__init__()
         self.config: Config = config
+        self.mod_ref: Optional[str] = None
+        self.class_names: List[str] = []
+
+    def visit_ImportFrom(self, node: cst.ImportFrom) -> Optional[bool]:
+        # reset state of previous statement, transformer could be reused for multiple statements
         self.mod_ref = None
         self.class_names = []
 
-    def _get_attr_nested_value(self, node: cst.Attribute) -> str:
-        if m.matches(node.value, m.TypeOf(m.Name)):
-            return f"{node.value.value}.{node.attr.value}"
-        elif m.matches(node.value, m.TypeOf(m.Attribute)):
-            nested = self._get_attr_nested_value(
-                cst.ensure_type(node.value, cst.Attribute)
-            )
-            return f"{nested}.{node.attr.value}"
-
-    def visit_ImportFrom(self, node: cst.ImportFrom) -> Optional[bool]:
-        # case ``from modules import class``
-        if m.matches(node.module, m.TypeOf(m.Name)):
-            self.mod_ref = node.module.value
-        # case ``from package.module.[module1] import class``
-        elif m.matches(node.module, m.TypeOf(m.Attribute)):
-            self.mod_ref = self._get_attr_nested_value(
-                cst.ensure_type(node.module, cst.Attribute)
-            )
+        # case ``from modules import class`` and ``from package.module.[module1] import class``, get the
+        # dotted name in one pass instead of matching ``Name`` and nested ``Attribute`` separately
+        if node.module is not None:
+            self.mod_ref = get_full_name_for_node(node.module)
 
         # skip ``import *``, aka ImportStar
         if isinstance(node.names, Sequence):
-            self.class_names = [
-                cst.ensure_type(ia, cst.ImportAlias).name.value for ia in node.names
-            ]
+            self.class_names = [ia.evaluated_name for ia in node.names]
         return False
 
     def leave_ImportFrom(
@@ -69,14 +71,14 @@ class ImportTransformer(cst.CSTTransformer):
                 f"{self.mod_ref}.{class_name}" for class_name in self.class_names
             ]
 
-            replaces = []
-            adds = set()
-            remove = set()
+            replaces: List[str] = []
+            adds: Set[str] = set()
+            remove: Set[str] = set()
             for full_ref in src_full_refs:
                 if full_ref in self.config.imports:
                     dest: ImportConfig = self.config.imports[full_ref]
                     if dest.remove:
-                        remove.update(full_ref)
+                        remove.add(full_ref)
                     replaces.append(dest.replace)
                     adds.update(dest.add)
 
@@ -84,23 +86,20 @@ class ImportTransformer(cst.CSTTransformer):
             if remove:
                 return cst.RemoveFromParent()
 
-            # get replace statement
+            # get replace statement, combine all the replaced names into the first one
             if len(replaces) == 0:
                 return updated_node
-            elif len(replaces) == 1:
-                statement = replaces[0]
-            else:
-                class_name_only = [
-                    stat.split(f" {Token.IMPORT} ")[1] for stat in replaces[1:]
-                ]
-                statement = f"{Token.COMMA} ".join(replaces[:1] + class_name_only)
+            statement = _parse_import(replaces[0])
+            if len(replaces) > 1:
+                names: List[cst.ImportAlias] = []
+                for replace in replaces:
+                    parsed_names = _parse_import(replace).names
+                    # rules never replace to ``import *``, aka ImportStar
+                    if isinstance(parsed_names, Sequence):
+                        names.extend(parsed_names)
+                statement = statement.with_changes(names=names)
 
             # Return replace and add statement
             # TODO, will use ; as separator of multiple statements, we should better use \n in the future
-            return FlattenSentinel(
-                [
-                    *[cst.parse_statement(add).body[0] for add in adds],
-                    cst.parse_statement(statement).body[0],
-                ]
-            )
+            return FlattenSentinel([*[_parse_import(add) for add in adds], statement])
         return updated_node
@@ -1,4 +1,4 @@
-import copy
+from functools import lru_cache
 from typing import Optional, Sequence, Union
 
 import libcst as cst
@@ -9,6 +9,23 @@ from air2phin.constants import Keyword, Token
 from air2phin.core.rules.config import CallConfig, Config, ParamDefaultConfig
 from air2phin.utils import string
 
+# Nodes in libcst are immutable, so constant nodes can be shared instead of being created for each node
+_DEFAULT_SCHEDULE = cst.SimpleString(f"'{Keyword.DEFAULT_SCHEDULE}'")
+
+
+@lru_cache(maxsize=None)
+def _default_value(default: ParamDefaultConfig) -> BaseExpression:
+    """Build and cache CST node for default value in rules, rules are fixed so each one only build once.
+
+    :param default: Default value config of parameter from rules.
+    """
+    if default.type == Token.STRING:
+        return cst.SimpleString(value=f'"{default.value}"')
+    elif default.type == Token.CODE:
+        return cst.parse_expression(default.value)
+    else:
+        raise NotImplementedError
+
 
 class OpTransformer(cst.CSTTransformer):
     """CST Transformer for airflow operators.
@@ -23,12 +40,13 @@ class OpTransformer(cst.CSTTransformer):
         self._config: Config = config
         self.qualified_name = qualified_name
         assert self.qualified_name is not None
+        self._call_config: CallConfig = self._config.calls.get(self.qualified_name)
         self.visit_name = False
         self.migrated_param = set()
 
     @property
     def config(self) -> CallConfig:
-        return self._config.calls.get(self.qualified_name)
+        return self._call_config
 
     def matcher_op_name(self, node: cst.Name) -> bool:
         if self.visit_name is False and node.value == self.config.src_short:
@@ -37,19 +55,10 @@ class OpTransformer(cst.CSTTransformer):
         return False
 
     def match_replace_name(self, node: cst.Arg) -> bool:
-        migrate_names = self.config.replace.keys()
-        return m.matches(
-            node,
-            m.Arg(keyword=m.Name(m.MatchIfTrue(lambda name: name in migrate_names))),
-        )
+        return node.keyword is not None and node.keyword.value in self.config.replace
 
     def match_remove_name(self, node: cst.Arg) -> bool:
-        return m.matches(
-            node,
-            m.Arg(
-                keyword=m.Name(m.MatchIfTrue(lambda name: name in self.config.remove))
-            ),
-        )
+        return node.keyword is not None and node.keyword.value in self.config.remove
 
     def match_call_name(self, node: cst.Call) -> bool:
         if m.matches(node.func, m.TypeOf(m.Name)):
@@ -75,9 +84,7 @@ class OpTransformer(cst.CSTTransformer):
                 node,
                 m.Arg(value=m.SimpleString()),
             ):
-                return node.with_changes(
-                    value=cst.SimpleString(f"'{Keyword.DEFAULT_SCHEDULE}'")
-                )
+                return node.with_changes(value=_DEFAULT_SCHEDULE)
 
             orig_value = cst.ensure_type(node.value, cst.SimpleString).value
             value = string.convert_schedule(orig_value.strip("'").strip('"'))
@@ -125,19 +132,13 @@ class OpTransformer(cst.CSTTransformer):
 
     def _handle_missing_default(self, nodes: Sequence[cst.Arg]) -> Sequence[cst.Arg]:
         mutable = list(nodes)
-        one_of = copy.deepcopy(mutable[-1])
+        # nodes are immutable, use the last one as template directly without copy
+        one_of = mutable[-1]
         for arg in self.config.add.keys():
             default: ParamDefaultConfig = self.config.add.get(arg)
-
-            if default.type == Token.STRING:
-                value = cst.SimpleString(value=f'"{default.value}"')
-            elif default.type == Token.CODE:
-                value = cst.parse_expression(default.value)
-            else:
-                raise NotImplementedError
             mutable.append(
                 one_of.with_changes(
-                    value=value,
+                    value=_default_value(default),
                     keyword=cst.Name(value=arg),
                 )
             )
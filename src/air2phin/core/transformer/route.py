@@ -45,6 +45,7 @@ class Transformer(cst.CSTTransformer):
     def __init__(self, config: Config):
         super().__init__()
         self.config: Config = config
+        self.import_transformer = ImportTransformer(config)
         self.workflow_alias = set()
         self.have_submit_expr = set()
 
@@ -83,8 +84,21 @@ class Transformer(cst.CSTTransformer):
     ) -> Union[
         cst.BaseSmallStatement, FlattenSentinel[cst.BaseSmallStatement], RemovalSentinel
     ]:
-        """Migrate from import statement."""
-        return updated_node.visit(ImportTransformer(self.config))
+        """Migrate from import statement.
+
+        Skip import statement directly when its root module not in any rules, most of the import statements
+        in DAG files are standard or third-party libraries.
+        """
+        root = updated_node.module
+        while isinstance(root, cst.Attribute):
+            root = root.value
+        if not isinstance(root, cst.Name) or root.value not in self.config.import_roots:
+            return updated_node
+
+        # Call import transformer within the current traversal instead of visiting the node by a new one,
+        # it does not visit children of import statement
+        self.import_transformer.visit_ImportFrom(updated_node)
+        return self.import_transformer.leave_ImportFrom(original_node, updated_node)
 
     def leave_WithItem_asname(self, node: cst.WithItem) -> None:
         """Get airflow Dags alias names."""
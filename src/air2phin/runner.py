@@ -83,6 +83,7 @@ class Runner:
         :param paths: Path of file you want to migrate.
         :param processes: multiprocess processes cpu count number.
         """
+        processes = processes or multiprocessing.cpu_count()
         logger.info(
             "Start multiple processing migrate files, total %d files scan.", len(paths)
         )
@@ -93,8 +94,17 @@ class Runner:
         )
 
         start = timer()
-        with Pool(processes) as pool:
-            list(tqdm(pool.imap(self.with_file, paths), total=len(paths)))
+        self.config.load_migrators()
+        chunksize = max(1, len(paths) // (processes * 4))
+        with Pool(
+            processes, initializer=_init_process, initargs=(self.config,)
+        ) as pool:
+            list(
+                tqdm(
+                    pool.imap(_migrate_process, paths, chunksize=chunksize),
+                    total=len(paths),
+                )
+            )
 
         logger.debug(
             "All files had add to multiprocess pool, spend time %.5fs.", timer() - start
@@ -104,3 +114,21 @@ class Runner:
         logger.info(
             f"Total migrated {len(paths)} files, spend time: %.5fs.", timer() - start
         )
+
+
+# Runner of each worker process in :meth:`Runner.with_files_multiprocess`, created once per process instead
+# of pickling runner for each file
+_process_runner: Optional[Runner] = None
+
+
+def _init_process(config: Config) -> None:
+    """Initialize runner for worker process of :meth:`Runner.with_files_multiprocess`."""
+    global _process_runner
+    _process_runner = Runner(config)
+
+
+def _migrate_process(path: Path) -> None:
+    """Migrate a single file in worker process of :meth:`Runner.with_files_multiprocess`."""
+    if _process_runner is None:
+        raise RuntimeError("Runner of worker process is not initialized.")
+    _process_runner.with_file(path)
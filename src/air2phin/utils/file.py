@@ -1,10 +1,29 @@
-from pathlib import Path
-from typing import Any, Dict, List, Optional
+import fnmatch
+import os
+import re
+import stat
+from collections import deque
+from functools import lru_cache
+from pathlib import Path, PurePath
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Sequence,
+    Tuple,
+)
 
 import yaml
 
 from air2phin.constants import Regexp
 
+# Directories prefix will be skipped when recurse files, they are hidden or cache directories
+SKIP_DIR_PREFIX = (".", "__pycache__")
+
 
 def read(path: Path) -> str:
     """Read content from path.
@@ -53,22 +72,106 @@ def add_stem_suffix(path: Path, suf: str) -> Path:
     return path.with_name(new_name)
 
 
+@lru_cache(maxsize=None)
+def _compile_pattern(pattern: str) -> Tuple[Optional[Pattern], ...]:
+    """Compile ``Path.rglob`` style pattern to regular expression for each part of path.
+
+    Pattern is split with :class:`pathlib.PurePath` the same as ``Path.rglob``, so ``.`` parts are dropped
+    and the platform's separators are respected, and parts are matched case-insensitively on case-insensitive
+    platforms like Windows. Part ``**`` is compiled to ``None`` which match zero or more directories, and the
+    leading ``**`` is always added because ``Path.rglob`` match pattern in all subdirectories. The result is
+    cached, so the same pattern is only compiled once even it is used by multiple sources paths.
+
+    :param pattern: ``Path.rglob`` style pattern, like ``*.py`` or ``utils/*``.
+    """
+    pure = PurePath(pattern)
+    if pure.anchor:
+        raise NotImplementedError("Non-relative patterns are unsupported")
+    flags = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+    return (None,) + tuple(
+        None if part == "**" else re.compile(fnmatch.translate(part), flags)
+        for part in pure.parts
+    )
+
+
+def _match_parts(patterns: Sequence[Optional[Pattern]], parts: Sequence[str]) -> bool:
+    """Match whether relative file path parts match the compiled pattern parts.
+
+    :param patterns: Compiled pattern from :func:`_compile_pattern`.
+    :param parts: Parts of file path relative to the recurse root.
+    """
+    if not patterns:
+        return not parts
+    head, rest = patterns[0], patterns[1:]
+    if head is None:
+        # ``**`` only match directories, the last part always be matched by the rest patterns
+        return any(_match_parts(rest, parts[idx:]) for idx in range(len(parts)))
+    return (
+        bool(parts)
+        and head.match(parts[0]) is not None
+        and _match_parts(rest, parts[1:])
+    )
+
+
+def _iter_files(root: str, skip_dirs: bool = False) -> Iterator[Tuple[str, ...]]:
+    """Iterate all files in directory with :func:`os.scandir` level by level, yield their relative path parts.
+
+    Directory entries would cache the file type, so it has fewer ``stat`` syscalls than ``Path.rglob``,
+    symlink directories are not followed as ``Path.rglob`` does.
+
+    :param root: Directory path want to iterate.
+    :param skip_dirs: Skip directories start with any of :data:`SKIP_DIR_PREFIX`, like ``.git`` or
+        ``__pycache__``, before entering them.
+    """
+    queue: Deque[Tuple[str, Tuple[str, ...]]] = deque([(root, ())])
+    while queue:
+        directory, parts = queue.popleft()
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except PermissionError:
+            continue
+
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if not (skip_dirs and entry.name.startswith(SKIP_DIR_PREFIX)):
+                    queue.append((entry.path, parts + (entry.name,)))
+            elif entry.is_file():
+                yield parts + (entry.name,)
+
+
 def recurse_files(
-    path: Path, include: Optional[str] = Regexp.PATH_ALL, exclude: Optional[str] = None
+    path: Path,
+    include: Optional[str] = Regexp.PATH_ALL,
+    exclude: Optional[str] = None,
+    skip_dirs: Optional[bool] = False,
 ) -> List[Path]:
     """Recurse all match pattern files in path.
 
+    Both :param:``include`` and :param:``exclude`` respect ``Path.rglob`` rule.
+
     :param path: file or directory path want to recurse.
     :param include: include match pattern in given path, default include all file in directory.
     :param exclude: include match pattern in given path, default None.
+    :param skip_dirs: Skip hidden and cache directories start with any of :data:`SKIP_DIR_PREFIX` inside
+        :param:``path``, default False.
     """
-    if not path.exists():
+    # use single ``os.stat`` instead of ``Path.exists`` and ``Path.is_file`` to reduce syscalls
+    try:
+        mode = os.stat(path).st_mode
+    except (FileNotFoundError, NotADirectoryError):
         raise ValueError("Path %s does not exist.", path)
 
-    if path.is_file():
+    if stat.S_ISREG(mode):
         return [path]
+    elif not stat.S_ISDIR(mode):
+        return []
     else:
-        paths = set(path.rglob(include))
-        if exclude:
-            paths = paths - set(path.rglob(exclude))
-        return [file for file in paths if file.is_file()]
+        include_pat = _compile_pattern(include)
+        exclude_pat = _compile_pattern(exclude) if exclude else None
+        return [
+            path.joinpath(*parts)
+            for parts in _iter_files(str(path), skip_dirs)
+            if _match_parts(include_pat, parts)
+            and not (exclude_pat and _match_parts(exclude_pat, parts))
+        ]
@@ -1,8 +1,11 @@
-from typing import Dict, List
+import argparse
+from pathlib import Path
+from typing import Dict, List, Optional, Set
 
 import pytest
 
-from air2phin.cli.command import build_argparse
+from air2phin.cli.command import build_argparse, main
+from air2phin.runner import Runner
 
 
 @pytest.mark.parametrize(
@@ -28,3 +31,78 @@ def test_command_args(argv: List[str], expect: Dict):
     parser = build_argparse()
     args = parser.parse_args(argv)
     assert all(val == getattr(args, key) for key, val in expect.items())
+
+
+@pytest.mark.parametrize(
+    "subcommand, expect",
+    [
+        (None, {"test", "migrate", "rule"}),
+        ("--help", {"test", "migrate", "rule"}),
+        ("migrate", {"migrate"}),
+        ("rule", {"rule"}),
+    ],
+)
+def test_build_argparse_subcommand(subcommand: Optional[str], expect: Set[str]):
+    parser = build_argparse(subcommand)
+    subparsers = next(
+        action
+        for action in parser._actions
+        if isinstance(action, argparse._SubParsersAction)
+    )
+    assert set(subparsers.choices) == expect
+
+
+def test_build_argparse_cached():
+    assert build_argparse("migrate") is build_argparse("migrate")
+    assert build_argparse() is build_argparse("--help")
+    assert build_argparse("migrate") is not build_argparse()
+
+
+@pytest.mark.parametrize(
+    "argv, expect",
+    [
+        (["dags/a.py", "dags"], ["dags/a.py", "dags/utils/u.py"]),
+        (["dags", "dags/utils"], ["dags/a.py", "dags/utils/u.py"]),
+        (["dags/utils", "dags"], ["dags/a.py", "dags/utils/u.py"]),
+        (
+            ["dags", "dags/.hidden"],
+            ["dags/a.py", "dags/utils/u.py", "dags/.hidden/h.py"],
+        ),
+        (["-E", "utils/*", "dags", "dags/utils"], ["dags/a.py", "dags/utils/u.py"]),
+    ],
+)
+def test_migrate_overlap_sources(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, argv: List[str], expect: List[str]
+):
+    for file in ["dags/a.py", "dags/utils/u.py", "dags/.hidden/h.py"]:
+        tmp_path.joinpath(file).parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.joinpath(file).touch()
+
+    migrated: List[Path] = []
+    monkeypatch.setattr(
+        Runner, "with_files", lambda self, paths: migrated.extend(paths)
+    )
+    monkeypatch.chdir(tmp_path)
+
+    main(["migrate", *argv])
+    assert sorted(migrated) == sorted(Path(f) for f in expect)
+
+
+@pytest.mark.parametrize(
+    "stdin, expect",
+    [
+        (
+            "from airflow import DAG",
+            "+from pydolphinscheduler.core.process_definition import ProcessDefinition\n",
+        ),
+        (
+            "from airflow import DAG\n",
+            "+from pydolphinscheduler.core.process_definition import ProcessDefinition\n",
+        ),
+        ("import os\n", "The different between source and target is: \n\n"),
+    ],
+)
+def test_test_diff_output(capsys: pytest.CaptureFixture, stdin: str, expect: str):
+    main(["test", "--diff", stdin])
+    out = capsys.readouterr().out
+    assert out.endswith(expect)
@@ -0,0 +1,19 @@
+from pathlib import Path
+
+from air2phin.constants import Keyword
+from air2phin.core.rules.config import Config
+from air2phin.runner import Runner
+from air2phin.utils.file import add_stem_suffix, read
+
+src = "from airflow.operators.bash import BashOperator\n"
+dest = "from pydolphinscheduler.tasks.shell import Shell\n"
+
+
+def test_with_files_multiprocess(tmp_path: Path) -> None:
+    paths = [tmp_path.joinpath("dag1.py"), tmp_path.joinpath("dag2.py")]
+    for path in paths:
+        path.write_text(src)
+
+    Runner(Config()).with_files_multiprocess(paths, 2)
+    for path in paths:
+        assert read(add_stem_suffix(path, Keyword.MIGRATE_MARK)) == dest
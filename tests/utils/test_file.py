@@ -0,0 +1,70 @@
+from pathlib import Path
+from typing import List, Optional
+
+import pytest
+
+from air2phin.utils.file import recurse_files
+
+files = [
+    "dag.py",
+    "dag.yaml",
+    "dags/dag-1.py",
+    "dags/utils/helper.py",
+    "utils/helper.py",
+    "utils/sub/helper.py",
+]
+
+
+@pytest.mark.parametrize(
+    "include, exclude, expect",
+    [
+        ("**/*", None, files),
+        ("*.py", None, [f for f in files if f.endswith(".py")]),
+        ("dag-*.py", None, ["dags/dag-1.py"]),
+        ("utils/*", None, ["dags/utils/helper.py", "utils/helper.py"]),
+        (
+            "utils/**/*.py",
+            None,
+            ["dags/utils/helper.py", "utils/helper.py", "utils/sub/helper.py"],
+        ),
+        ("*.py", "utils/*", ["dag.py", "dags/dag-1.py", "utils/sub/helper.py"]),
+        ("./*.py", None, [f for f in files if f.endswith(".py")]),
+        ("./utils/./*", None, ["dags/utils/helper.py", "utils/helper.py"]),
+    ],
+)
+def test_recurse_files(
+    tmp_path: Path, include: str, exclude: Optional[str], expect: List[str]
+) -> None:
+    for file in files:
+        tmp_path.joinpath(file).parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.joinpath(file).touch()
+
+    paths = recurse_files(tmp_path, include, exclude)
+    assert sorted(paths) == sorted(tmp_path.joinpath(f) for f in expect)
+
+
+def test_recurse_files_single_file(tmp_path: Path) -> None:
+    file = tmp_path.joinpath("dag.py")
+    file.touch()
+    assert recurse_files(file, "*.yaml") == [file]
+
+
+def test_recurse_files_not_exists(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        recurse_files(tmp_path.joinpath("not-exists"))
+
+
+def test_recurse_files_skip_dirs(tmp_path: Path) -> None:
+    for file in [".git/hook.py", "__pycache__/dag.py", "dags/.venv/lib.py", "dag.py"]:
+        tmp_path.joinpath(file).parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.joinpath(file).touch()
+
+    assert recurse_files(tmp_path, "*.py", skip_dirs=True) == [
+        tmp_path.joinpath("dag.py")
+    ]
+    assert len(recurse_files(tmp_path, "*.py")) == 4
+
+
+def test_recurse_files_absolute_pattern(tmp_path: Path) -> None:
+    with pytest.raises(NotImplementedError):
+        recurse_files(tmp_path, "/*.py")